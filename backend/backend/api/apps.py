@@ -4,4 +4,7 @@ class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
     label = 'wildforge_api'
-    verbose_name = "Wildforge API"
\ No newline at end of file
+    verbose_name = "Wildforge API"
+
+    def ready(self):
+        from . import signals  # noqa: F401
\ No newline at end of file
@@ -5,7 +5,12 @@ from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Exists, Count, Max
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 
 from api.custom_permissions import IsTeacher, IsModerator
 
@@ -17,28 +22,60 @@ from api.models import ActivityWorkAttachment
 
 from api.serializers import ActivityWorkAttachmentSerializer
 from api.serializers import ActivitySerializer
-from api.serializers import ActivityTemplateSerializer
 from api.serializers import ActivityCreateFromTemplateSerializer
 from api.serializers import ClassRoomSerializer
 from api.serializers import TeamSerializer
 
+# Shared by the write endpoints so ActivitySerializer builds its field layout once
+# per process instead of once per response
+activity_serializer = ActivitySerializer()
+
+def activity_list_etag(request, class_pk=None, team_pk=None, **kwargs):
+    # date_created is auto_now, so any saved change moves the latest value and a
+    # deletion changes the count
+    # Malformed ids skip the ETag so the view still returns its own error body
+    try:
+        activities = Activity.objects.filter(classroom_id=class_pk)
+        if team_pk is not None:
+            activities = activities.filter(team_id=team_pk)
+
+        latest = activities.aggregate(latest_date_created=Max('date_created'), total=Count('id'))
+    except (ValueError, TypeError):
+        return None
+
+    # Empty lists skip the ETag so the view still decides between 404 and []
+    if latest['total']:
+        # team_id comes from the through table, which changes without saving the
+        # activity. Through ids only grow, so an added link moves the latest id
+        # and a removed one, including a Team delete cascade, changes the count
+        team_links = Activity.team_id.through.objects.filter(
+            activity_id__in=activities.values('pk')
+        ).aggregate(latest_id=Max('id'), total=Count('id'))
+
+        return (
+            f"{latest['latest_date_created'].timestamp()}-{latest['total']}"
+            f"-{team_links['latest_id']}-{team_links['total']}"
+        )
+
 class ActivityController(viewsets.GenericViewSet,
                       mixins.CreateModelMixin,
                       mixins.RetrieveModelMixin,
                       mixins.UpdateModelMixin,
                       mixins.DestroyModelMixin):
-    queryset = Activity.objects.all()
     serializer_class = ActivitySerializer
     authentication_classes = [JWTAuthentication]
 
     def get_permissions(self):
-        if self.action in ['create', 'create_from_template', 
+        if self.action in ['create', 'create_from_template', 'bulk_create',
                            'destroy', 'add_evaluation', 'delete_evaluation',
                            ]:
             return [permissions.IsAuthenticated(), IsTeacher(), IsModerator()]
         else:
             return [permissions.IsAuthenticated()]
 
+    def get_queryset(self):
+        return Activity.objects.with_team_ids().filter(classroom_id=self.kwargs.get('class_pk'))
+
     @swagger_auto_schema(
         operation_summary="Creates a new activity",
         operation_description="POST /activities",
@@ -52,43 +89,63 @@ class ActivityController(viewsets.GenericViewSet,
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response('Internal Server Error', message='Internal Server Error. An unexpected error occurred.'),
         }
     )
+    @transaction.atomic
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
             activity_data = serializer.validated_data
-            team_ids = request.data.get('team_id', [])
-
-            if team_ids:
-                try:
-                    teams = Team.objects.filter(pk__in=team_ids)
-
-                    # Use transaction.atomic to ensure all or nothing behavior
-                    with transaction.atomic():
-                        activity_instances = []
-                        for team in teams:
-                            # Create a new activity instance for each team
-                            new_activity = Activity.objects.create(
-                                classroom_id=activity_data.get('classroom_id'),
-                                title=activity_data.get('title'),
-                                description=activity_data.get('description'),
-                                submission_status=activity_data.get('submission_status', False),
-                                due_date=activity_data.get('due_date'),
-                                evaluation=activity_data.get('evaluation'),
-                                total_score=activity_data.get('total_score', 100)
-                            )
-                            new_activity.team_id.add(team)
-                            activity_instances.append(new_activity)
-
-                    activity_serializer = self.get_serializer(activity_instances, many=True)
-                    return Response(activity_serializer.data, status=status.HTTP_201_CREATED)
-                except Team.DoesNotExist:
-                    return Response({'error': 'One or more teams not found'}, status=status.HTTP_404_NOT_FOUND)
+            # The serializer already resolved every team id while validating
+            teams = list(dict.fromkeys(activity_data.get('team_id', [])))
+
+            if teams:
+                activity_instances = []
+                for team in teams:
+                    # Create a new activity instance for each team
+                    new_activity = Activity.objects.create(
+                        classroom_id=activity_data.get('classroom_id'),
+                        title=activity_data.get('title'),
+                        description=activity_data.get('description'),
+                        submission_status=activity_data.get('submission_status', False),
+                        due_date=activity_data.get('due_date'),
+                        evaluation=activity_data.get('evaluation'),
+                        total_score=activity_data.get('total_score', 100)
+                    )
+                    new_activity.team_id.add(team)
+                    activity_instances.append(new_activity)
+
+                activities = [activity_serializer.to_representation(activity) for activity in activity_instances]
+                return Response(activities, status=status.HTTP_201_CREATED)
             else:
                 return Response({'error': 'Invalid or empty Team IDs provided'}, status=status.HTTP_400_BAD_REQUEST)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @swagger_auto_schema(
+        operation_summary="Creates several activities at once",
+        operation_description="POST /classes/{class_pk}/activities/bulk",
+        request_body=ActivitySerializer(many=True),
+        responses={
+            status.HTTP_201_CREATED: openapi.Response('Created', ActivitySerializer(many=True)),
+            status.HTTP_400_BAD_REQUEST: openapi.Response('Bad Request', message='Bad Request. Invalid or missing data in the request.'),
+            status.HTTP_401_UNAUTHORIZED: openapi.Response('Unauthorized', message='Unauthorized. Authentication required.'),
+            status.HTTP_403_FORBIDDEN: openapi.Response('Forbidden', message='Forbidden. You do not have permission to access this resource.'),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response('Internal Server Error', message='Internal Server Error. An unexpected error occurred.'),
+        }
+    )
+    @action(detail=False, methods=['POST'], url_path='bulk')
+    @transaction.atomic
+    def bulk_create(self, request, class_pk=None):
+        serializer = self.get_serializer(data=request.data, many=True)
+
+        if serializer.is_valid():
+            # The class always comes from the URL, which IsTeacher has checked
+            activities = serializer.save(classroom_id_id=int(class_pk))
+            activities = ActivitySerializer.values(Activity.objects.filter(pk__in=[activity.pk for activity in activities]).order_by('pk'))
+            return Response(activities, status=status.HTTP_201_CREATED)
+        else:
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
     @swagger_auto_schema(
         operation_summary="Lists all activities of a class",
         operation_description="GET /classes/{class_pk}/activities",
@@ -100,14 +157,15 @@ class ActivityController(viewsets.GenericViewSet,
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response('Internal Server Error', message='Internal Server Error. An unexpected error occurred.'),
         }
     )
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=activity_list_etag))
     def list(self, request, *args, **kwargs):
         class_id = kwargs.get('class_pk', None)
 
         if class_id:
             try:
-                activities = Activity.objects.filter(classroom_id=class_id)
-                serializer = self.get_serializer(activities, many=True)
-                return Response(serializer.data)
+                activities = ActivitySerializer.values(self.filter_queryset(self.get_queryset()))
+                return Response(activities)
             except Exception as e:
                 return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         else:
@@ -126,55 +184,63 @@ class ActivityController(viewsets.GenericViewSet,
     }
     )
     @action(detail=False, methods=['POST'])
+    @transaction.atomic
     def create_from_template(self, request, class_pk=None, pk=None):
-        template_id = request.data.get('template_id', None)
-        team_ids = request.data.get('team_ids', [])
-        due_date = request.data.get('due_date', None)
-        evaluation = request.data.get('evaluation', None)
-        total_score = request.data.get('total_score', None)
+        serializer = ActivityCreateFromTemplateSerializer(data=request.data)
+
+        if serializer.is_valid():
+            data = serializer.validated_data
+            template_id = data['template_id']
+            team_ids = data['team_ids']
 
-        if template_id is not None and class_pk is not None:
+            # Templates rarely change, cached entries are dropped by api.signals
             try:
-                class_obj = ClassRoom.objects.get(pk=class_pk)
-                template = ActivityTemplate.objects.get(pk=template_id)
-
-                with transaction.atomic():
-                    activity_instances = []
-                    for team_id in team_ids:
-                        try:
-                            team = Team.objects.get(pk=team_id)
-                            new_activity = Activity.create_activity_from_template(template)
-
-                            # Update due_date, evaluation, and total_score
-                            if due_date:
-                                new_activity.due_date = due_date
-                            if evaluation:
-                                new_activity.evaluation = evaluation
-                            if total_score:
-                                new_activity.total_score = total_score
-
-                            # Set the class and team for the new activity
-                            new_activity.classroom_id = class_obj
-                            new_activity.team_id.add(team)
-
-                            new_activity.save()
-                            activity_instances.append(new_activity)
-                        except Team.DoesNotExist:
-                            return Response({"error": f"Team with ID {team_id} not found"}, status=status.HTTP_404_NOT_FOUND)
-
-                activity_serializer = self.get_serializer(activity_instances, many=True)
-                return Response(activity_serializer.data, status=status.HTTP_201_CREATED)
-            except (ActivityTemplate.DoesNotExist, ClassRoom.DoesNotExist) as e:
+                template = cache.get_or_set(
+                    ActivityTemplate.cache_key(template_id),
+                    lambda: ActivityTemplate.objects.only('title', 'description').get(pk=template_id),
+                    timeout=300
+                )
+            except ActivityTemplate.DoesNotExist as e:
                 return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+
+            # Validate every team id with one query before creating anything
+            existing_team_ids = set(Team.objects.filter(pk__in=team_ids).values_list('pk', flat=True))
+            for team_id in team_ids:
+                if team_id not in existing_team_ids:
+                    return Response({"error": f"Team with ID {team_id} not found"}, status=status.HTTP_404_NOT_FOUND)
+
+            # Set the class, due_date, evaluation, and total_score up front
+            # so each activity is written with a single INSERT. The class is
+            # already known to exist through the IsTeacher permission, so only
+            # its id is needed for the foreign key
+            activity_fields = {'classroom_id_id': int(class_pk)}
+            for field in ('due_date', 'evaluation', 'total_score'):
+                if data.get(field):
+                    activity_fields[field] = data[field]
+
+            activity_instances = [
+                Activity.create_activity_from_template(template, **activity_fields)
+                for team_id in team_ids
+            ]
+
+            # Link every new activity to its team with one INSERT, instead of
+            # the SELECT and INSERT that each team_id.add() issues
+            ActivityTeam = Activity.team_id.through
+            ActivityTeam.objects.bulk_create([
+                ActivityTeam(activity_id=activity.pk, team_id=team_id)
+                for activity, team_id in zip(activity_instances, team_ids)
+            ])
+
+            activities = [activity_serializer.to_representation(activity) for activity in activity_instances]
+            return Response(activities, status=status.HTTP_201_CREATED)
         else:
-            return Response({"error": "Template ID or Class ID not provided"}, status=status.HTTP_400_BAD_REQUEST)
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
             
 class TeamActivitiesController(viewsets.GenericViewSet,
                       mixins.CreateModelMixin,
                       mixins.RetrieveModelMixin,
                       mixins.UpdateModelMixin,
                       mixins.DestroyModelMixin):
-    queryset = Activity.objects.all()
     serializer_class = ActivitySerializer
     authentication_classes = [JWTAuthentication]
 
@@ -185,6 +251,9 @@ class TeamActivitiesController(viewsets.GenericViewSet,
         else:
             return [permissions.IsAuthenticated()]
 
+    def get_queryset(self):
+        return Activity.objects.with_team_ids().filter(classroom_id=self.kwargs.get('class_pk'), team_id=self.kwargs.get('team_pk'))
+
     @swagger_auto_schema(
         operation_summary="Lists all activities of a team",
         operation_description="GET /classes/{class_pk}/teams/{team_pk}/activities",
@@ -197,18 +266,35 @@ class TeamActivitiesController(viewsets.GenericViewSet,
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response('Internal Server Error'),
         }
     )
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=activity_list_etag))
     def list(self, request, class_pk=None, team_pk=None):
         try:
             if class_pk is not None and team_pk is not None:
-                if not ClassRoom.objects.filter(pk=class_pk).exists():
-                    return Response({'error': 'Class not found'}, status=status.HTTP_404_NOT_FOUND)
-                
-                if not Team.objects.filter(pk=team_pk).exists():
-                    return Response({'error': 'Team not found'}, status=status.HTTP_404_NOT_FOUND)
+                activities = ActivitySerializer.values(self.filter_queryset(self.get_queryset()))
+
+                # An empty result is either a 404 or a team with no activities yet
+                if not activities:
+                    cache_key = f'class:{class_pk}:team:{team_pk}:exists'
+                    team_exists = cache.get(cache_key)
+
+                    if team_exists is None:
+                        # Resolve both existence checks in a single query
+                        team_exists = ClassRoom.objects.filter(pk=class_pk).annotate(
+                            team_exists=Exists(Team.objects.filter(pk=team_pk))
+                        ).values_list('team_exists', flat=True).first()
+
+                        # Only found ids are cached so newly created ones are never hidden
+                        if team_exists:
+                            cache.set(cache_key, True, timeout=60)
+
+                    if team_exists is None:
+                        return Response({'error': 'Class not found'}, status=status.HTTP_404_NOT_FOUND)
+
+                    if not team_exists:
+                        return Response({'error': 'Team not found'}, status=status.HTTP_404_NOT_FOUND)
 
-                activities = Activity.objects.filter(classroom_id=class_pk, team_id=team_pk)
-                serializer = self.get_serializer(activities, many=True)
-                return Response(serializer.data)
+                return Response(activities)
 
             elif team_pk is None:
                 return Response({'error': 'Team ID not provided'}, status=status.HTTP_400_BAD_REQUEST)
@@ -284,8 +370,7 @@ class TeamActivitiesController(viewsets.GenericViewSet,
             activity.submission_status = not activity.submission_status
             activity.save()
 
-            serializer = self.get_serializer(activity)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(activity_serializer.to_representation(activity), status=status.HTTP_200_OK)
         except Activity.DoesNotExist:
             return Response({'error': 'Activity not found'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
@@ -325,8 +410,7 @@ class TeamActivitiesController(viewsets.GenericViewSet,
             else:
                 return Response({'error': 'Evaluation score not provided'}, status=status.HTTP_400_BAD_REQUEST)
 
-            serializer = self.get_serializer(activity)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(activity_serializer.to_representation(activity), status=status.HTTP_200_OK)
         except Activity.DoesNotExist:
             return Response({'error': 'Activity not found'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
@@ -362,8 +446,7 @@ class TeamActivitiesController(viewsets.GenericViewSet,
             activity.evaluation = None
             activity.save()
 
-            serializer = self.get_serializer(activity)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(activity_serializer.to_representation(activity), status=status.HTTP_200_OK)
         except Activity.DoesNotExist:
             return Response({'error': 'Activity not found'}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
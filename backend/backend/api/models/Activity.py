@@ -1,5 +1,12 @@
 from django.db import models
 
+from .Team import Team
+
+class ActivityQuerySet(models.QuerySet):
+    def with_team_ids(self):
+        # Activities only ever render their teams as primary keys
+        return self.prefetch_related(models.Prefetch('team_id', queryset=Team.objects.only('id')))
+
 class Activity(models.Model):
     classroom_id = models.ForeignKey('ClassRoom', on_delete=models.CASCADE, null=True)
     team_id = models.ManyToManyField('Team', null=True)
@@ -11,12 +18,15 @@ class Activity(models.Model):
     evaluation = models.IntegerField(null=True)
     total_score = models.IntegerField(default=100, null=False)
 
+    objects = ActivityQuerySet.as_manager()
+
     @classmethod
-    def create_activity_from_template(cls, template):
+    def create_activity_from_template(cls, template, **fields):
         new_activity = cls(
             title=template.title,
             description=template.description,
             # Copy other fields from the template as needed
+            **fields
         )
         new_activity.save()
         return new_activity
@@ -5,5 +5,9 @@ class ActivityTemplate(models.Model):
     title = models.CharField(max_length=100)
     description = models.TextField(max_length=10000)
 
+    @staticmethod
+    def cache_key(pk):
+        return f'activity_template:{pk}'
+
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -1,16 +1,78 @@
+from collections.abc import Mapping
+
+from django.db import connection
 from rest_framework import serializers
 from api.models import Activity
 
+class ActivityListSerializer(serializers.ListSerializer):
+
+    def create(self, validated_data):
+        activities = []
+        for data in validated_data:
+            fields = {field: value for field, value in data.items() if field != 'team_id'}
+
+            # A class id passed to save() wins over the one in the payload
+            if 'classroom_id_id' in fields:
+                fields.pop('classroom_id', None)
+            activities.append(Activity(**fields))
+
+        # bulk_create only sets primary keys on backends that can return them
+        if connection.features.can_return_rows_from_bulk_insert:
+            Activity.objects.bulk_create(activities)
+        else:
+            for activity in activities:
+                activity.save()
+
+        ActivityTeam = Activity.team_id.through
+        ActivityTeam.objects.bulk_create([
+            ActivityTeam(activity_id=activity.pk, team_id=team.pk)
+            for activity, data in zip(activities, validated_data)
+            for team in dict.fromkeys(data.get('team_id', []))
+        ])
+        return activities
+
 class ActivitySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Activity
+        list_serializer_class = ActivityListSerializer
         fields = ('id', 'classroom_id', 'team_id', 'title', 'description', 'submission_status', 'date_created', 'due_date', 'evaluation', 'total_score')
 
+    @classmethod
+    def values(cls, queryset):
+        # Same output as ActivitySerializer(queryset, many=True).data for read-only
+        # lists, built from plain rows instead of a serializer per activity
+        rows = list(queryset.prefetch_related(None).values(*(field for field in cls.Meta.fields if field != 'team_id')))
+
+        datetime_field = serializers.DateTimeField()
+        team_ids = {row['id']: [] for row in rows}
+        for activity_id, team_id in Activity.team_id.through.objects.filter(activity_id__in=team_ids).values_list('activity_id', 'team_id'):
+            team_ids[activity_id].append(team_id)
+
+        for row in rows:
+            row['team_id'] = team_ids[row['id']]
+            for field in ('date_created', 'due_date'):
+                if row[field] is not None:
+                    row[field] = datetime_field.to_representation(row[field])
+        return [{field: row[field] for field in cls.Meta.fields} for row in rows]
+
 class ActivityCreateFromTemplateSerializer(serializers.Serializer):
     template_id = serializers.IntegerField()
-    team_ids = serializers.ListField(child=serializers.IntegerField())
-    due_date = serializers.DateTimeField()
-    evaluation = serializers.IntegerField()
-    total_score = serializers.IntegerField()
-    class_id = serializers.IntegerField() 
\ No newline at end of file
+    team_ids = serializers.ListField(child=serializers.IntegerField(), default=list)
+    due_date = serializers.DateTimeField(required=False, allow_null=True)
+    evaluation = serializers.IntegerField(required=False, allow_null=True)
+    total_score = serializers.IntegerField(required=False, allow_null=True)
+
+    def to_internal_value(self, data):
+        # Blank optional fields have always meant "not provided", and the activity
+        # form starts them as empty strings. Non-object bodies are left to DRF's
+        # own type check
+        if not isinstance(data, Mapping):
+            return super().to_internal_value(data)
+
+        blank_fields = [field for field in ('due_date', 'evaluation', 'total_score') if data.get(field) == '']
+        if blank_fields:
+            data = data.copy()
+            for field in blank_fields:
+                data[field] = None
+        return super().to_internal_value(data)
\ No newline at end of file
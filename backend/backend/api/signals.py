@@ -0,0 +1,9 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from api.models import ActivityTemplate
+
+@receiver([post_save, post_delete], sender=ActivityTemplate)
+def invalidate_activity_template_cache(sender, instance, **kwargs):
+    cache.delete(ActivityTemplate.cache_key(instance.pk))
@@ -0,0 +1,257 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+from api.models import User, ClassRoom, ClassMember, Team, Activity, ActivityTemplate
+from api.serializers import ActivitySerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+class ActivitiesTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+        # Create a teacher who can manage activities of the class
+        self.teacher = User.objects.create(
+            email='teacher@example.com',
+            password='userpassword',
+            first_name='Teacher',
+            last_name='User',
+            role=User.MODERATOR
+        )
+
+        self.classroom = ClassRoom.objects.create(
+            class_code='MATH0101',
+            course_name='Math 101',
+            sections='A',
+            schedule='MWF 9:00 AM - 10:00 AM'
+        )
+        self.other_classroom = ClassRoom.objects.create(
+            class_code='MATH0102',
+            course_name='Math 102',
+            sections='B',
+            schedule='TTH 9:00 AM - 10:00 AM'
+        )
+
+        ClassMember.objects.create(
+            user_id=self.teacher,
+            class_id=self.classroom,
+            role=ClassMember.TEACHER,
+            status=ClassMember.ACCEPTED
+        )
+
+        self.team_a = Team.objects.create(name='Team A')
+        self.team_b = Team.objects.create(name='Team B')
+
+        # Initialize the API client with authentication headers
+        teacher_refresh = RefreshToken.for_user(self.teacher)
+        self.client_teacher_user = APIClient()
+        self.client_teacher_user.credentials(HTTP_AUTHORIZATION=f'Bearer {teacher_refresh.access_token}')
+
+    def test_bulk_create_activities(self):
+        url = reverse('class-activities-bulk-create', kwargs={'class_pk': self.classroom.id})
+        data = [
+            {'title': 'Activity 1', 'description': 'First', 'team_id': [self.team_a.id]},
+            {'title': 'Activity 2', 'description': 'Second', 'team_id': [self.team_a.id, self.team_b.id]},
+        ]
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([activity['title'] for activity in response.data], ['Activity 1', 'Activity 2'])
+        self.assertEqual(response.data[1]['team_id'], [self.team_a.id, self.team_b.id])
+        self.assertEqual(Activity.objects.filter(classroom_id=self.classroom).count(), 2)
+
+    def test_bulk_create_uses_class_from_url(self):
+        url = reverse('class-activities-bulk-create', kwargs={'class_pk': self.classroom.id})
+        data = [
+            {'title': 'Activity 1', 'classroom_id': self.other_classroom.id, 'team_id': [self.team_a.id]},
+        ]
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data[0]['classroom_id'], self.classroom.id)
+        self.assertFalse(Activity.objects.filter(classroom_id=self.other_classroom).exists())
+
+    def test_bulk_create_duplicate_team_ids(self):
+        url = reverse('class-activities-bulk-create', kwargs={'class_pk': self.classroom.id})
+        data = [
+            {'title': 'Activity 1', 'team_id': [self.team_a.id, self.team_a.id]},
+        ]
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data[0]['team_id'], [self.team_a.id])
+
+    def test_bulk_create_invalid_team(self):
+        url = reverse('class-activities-bulk-create', kwargs={'class_pk': self.classroom.id})
+        data = [
+            {'title': 'Activity 1', 'team_id': [self.team_a.id]},
+            {'title': 'Activity 2', 'team_id': [999]},
+        ]
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Activity.objects.exists())
+
+    def test_values_matches_serializer(self):
+        multi_team = Activity.objects.create(
+            classroom_id=self.classroom,
+            title='Activity 1',
+            description='Two teams',
+            due_date='2024-01-15T08:30:00.123456Z',
+            evaluation=80
+        )
+        multi_team.team_id.add(self.team_a, self.team_b)
+        no_team = Activity.objects.create(classroom_id=self.classroom, title='Activity 2')
+
+        activities = Activity.objects.filter(classroom_id=self.classroom).order_by('pk')
+        rows = ActivitySerializer.values(activities)
+
+        self.assertEqual(rows, ActivitySerializer(activities, many=True).data)
+        self.assertEqual(list(rows[0]), list(ActivitySerializer.Meta.fields))
+        self.assertEqual(rows[0]['due_date'], '2024-01-15T08:30:00.123456Z')
+        self.assertEqual(sorted(rows[0]['team_id']), [self.team_a.id, self.team_b.id])
+        self.assertEqual(rows[1]['id'], no_team.id)
+        self.assertEqual(rows[1]['team_id'], [])
+        self.assertIsNone(rows[1]['due_date'])
+
+    def test_list_activities(self):
+        team_c = Team.objects.create(name='Team C')
+        for number in range(1, 6):
+            activity = Activity.objects.create(classroom_id=self.classroom, title=f'Activity {number}')
+            activity.team_id.add(self.team_a, self.team_b, team_c)
+        Activity.objects.create(classroom_id=self.other_classroom, title='Other class')
+
+        url = reverse('class-activities-list', kwargs={'class_pk': self.classroom.id})
+
+        # user, the two ETag aggregates, the activity rows and their team links,
+        # however many activities and teams the class has
+        with self.assertNumQueries(5):
+            response = self.client_teacher_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, ActivitySerializer(Activity.objects.filter(classroom_id=self.classroom), many=True).data)
+
+    def test_list_activities_not_modified(self):
+        activity = Activity.objects.create(classroom_id=self.classroom, title='Activity 1')
+        activity.team_id.add(self.team_a)
+
+        url = reverse('class-activities-list', kwargs={'class_pk': self.classroom.id})
+        response = self.client_teacher_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Browsers must revalidate so a list refetched after a write is never stale
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        etag = response['ETag']
+
+        response = self.client_teacher_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_activities_etag_changes_with_activity(self):
+        activity = Activity.objects.create(classroom_id=self.classroom, title='Activity 1')
+
+        url = reverse('class-activities-list', kwargs={'class_pk': self.classroom.id})
+        etag = self.client_teacher_user.get(url)['ETag']
+
+        activity.title = 'Renamed'
+        activity.save()
+        response = self.client_teacher_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+
+        # Deleting an older activity leaves the latest date_created unchanged
+        Activity.objects.create(classroom_id=self.classroom, title='Activity 2')
+        etag = self.client_teacher_user.get(url)['ETag']
+        activity.delete()
+        response = self.client_teacher_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_activities_etag_changes_with_teams(self):
+        activity = Activity.objects.create(classroom_id=self.classroom, title='Activity 1')
+        activity.team_id.add(self.team_a)
+
+        url = reverse('class-activities-list', kwargs={'class_pk': self.classroom.id})
+        etag = self.client_teacher_user.get(url)['ETag']
+
+        activity.team_id.add(self.team_b)
+        response = self.client_teacher_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(response.data[0]['team_id']), [self.team_a.id, self.team_b.id])
+        etag = response['ETag']
+
+        activity.team_id.remove(self.team_a)
+        response = self.client_teacher_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['team_id'], [self.team_b.id])
+        etag = response['ETag']
+
+        # Deleting a team cascades to the through rows only
+        self.team_b.delete()
+        response = self.client_teacher_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['team_id'], [])
+
+    def test_create_from_template_blank_fields(self):
+        template = ActivityTemplate.objects.create(course_name='Math', title='Template', description='From template')
+
+        url = reverse('class-activities-create-from-template', kwargs={'class_pk': self.classroom.id})
+        data = {
+            'template_id': template.id,
+            'team_ids': [self.team_a.id],
+            'due_date': '',
+            'evaluation': '',
+            'total_score': ''
+        }
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsNone(response.data[0]['due_date'])
+        self.assertIsNone(response.data[0]['evaluation'])
+        self.assertEqual(response.data[0]['total_score'], 100)
+
+    def test_create_from_template_multiple_teams(self):
+        template = ActivityTemplate.objects.create(course_name='Math', title='Template', description='From template')
+
+        url = reverse('class-activities-create-from-template', kwargs={'class_pk': self.classroom.id})
+        data = {'template_id': template.id, 'team_ids': [self.team_a.id, self.team_b.id]}
+
+        # user, class member, savepoint, template, teams, one INSERT per
+        # activity, a single INSERT for every team link, one team read per
+        # activity for the response and the savepoint release
+        with self.assertNumQueries(11):
+            response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([activity['team_id'] for activity in response.data], [[self.team_a.id], [self.team_b.id]])
+
+    def test_create_from_template_after_template_edit(self):
+        template = ActivityTemplate.objects.create(course_name='Math', title='Template', description='From template')
+
+        url = reverse('class-activities-create-from-template', kwargs={'class_pk': self.classroom.id})
+        data = {'template_id': template.id, 'team_ids': [self.team_a.id]}
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.data[0]['title'], 'Template')
+
+        # Saving the template drops its cached copy
+        template.title = 'Edited template'
+        template.save()
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data[0]['title'], 'Edited template')
+
+        template.delete()
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_create_from_template_not_found(self):
+        url = reverse('class-activities-create-from-template', kwargs={'class_pk': self.classroom.id})
+        data = {'template_id': 999, 'team_ids': [self.team_a.id]}
+
+        response = self.client_teacher_user.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('error', response.data)
+
+    def test_create_from_template_non_object_body(self):
+        url = reverse('class-activities-create-from-template', kwargs={'class_pk': self.classroom.id})
+
+        response = self.client_teacher_user.post(url, [1, 2], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('non_field_errors', response.data)
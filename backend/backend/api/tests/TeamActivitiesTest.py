@@ -0,0 +1,113 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+from api.models import User, ClassRoom, ClassMember, Team, Activity
+from rest_framework_simplejwt.tokens import RefreshToken
+
+class TeamActivitiesTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.student = User.objects.create(
+            email='student@example.com',
+            password='userpassword',
+            first_name='Student',
+            last_name='User'
+        )
+
+        self.classroom = ClassRoom.objects.create(
+            class_code='MATH0101',
+            course_name='Math 101',
+            sections='A',
+            schedule='MWF 9:00 AM - 10:00 AM'
+        )
+
+        ClassMember.objects.create(
+            user_id=self.student,
+            class_id=self.classroom,
+            role=ClassMember.STUDENT,
+            status=ClassMember.ACCEPTED
+        )
+
+        self.team_a = Team.objects.create(name='Team A')
+        self.team_b = Team.objects.create(name='Team B')
+
+        # Initialize the API client with authentication headers
+        student_refresh = RefreshToken.for_user(self.student)
+        self.client_student_user = APIClient()
+        self.client_student_user.credentials(HTTP_AUTHORIZATION=f'Bearer {student_refresh.access_token}')
+
+    def test_list_team_activities(self):
+        team_c = Team.objects.create(name='Team C')
+        for number in range(1, 6):
+            activity = Activity.objects.create(classroom_id=self.classroom, title=f'Activity {number}')
+            activity.team_id.add(self.team_a, self.team_b, team_c)
+        other = Activity.objects.create(classroom_id=self.classroom, title='Other team')
+        other.team_id.add(self.team_b)
+
+        url = reverse('team-activities-list', kwargs={'class_pk': self.classroom.id, 'team_pk': self.team_a.id})
+
+        # user, the two ETag aggregates, the activity rows and their team links,
+        # however many activities and teams the team has
+        with self.assertNumQueries(5):
+            response = self.client_student_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(activity['title'] for activity in response.data), [f'Activity {number}' for number in range(1, 6)])
+        for activity in response.data:
+            self.assertEqual(sorted(activity['team_id']), [self.team_a.id, self.team_b.id, team_c.id])
+
+    def test_list_team_activities_empty(self):
+        url = reverse('team-activities-list', kwargs={'class_pk': self.classroom.id, 'team_pk': self.team_a.id})
+
+        # The second request answers from the cached existence check
+        for _ in range(2):
+            response = self.client_student_user.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data, [])
+
+    def test_list_team_activities_class_not_found(self):
+        url = reverse('team-activities-list', kwargs={'class_pk': 999, 'team_pk': self.team_a.id})
+        response = self.client_student_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {'error': 'Class not found'})
+
+    def test_list_team_activities_team_not_found(self):
+        url = reverse('team-activities-list', kwargs={'class_pk': self.classroom.id, 'team_pk': 999})
+        response = self.client_student_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {'error': 'Team not found'})
+
+    def test_list_team_activities_invalid_id(self):
+        url = reverse('team-activities-list', kwargs={'class_pk': 'abc', 'team_pk': self.team_a.id})
+        response = self.client_student_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertIn('error', response.data)
+
+    def test_list_team_activities_found_after_not_found(self):
+        url = reverse('team-activities-list', kwargs={'class_pk': self.classroom.id, 'team_pk': 999})
+        response = self.client_student_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # Missing ids are never cached, so a team created later is found
+        Team.objects.create(id=999, name='Team C')
+        response = self.client_student_user.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+    def test_list_team_activities_not_modified(self):
+        activity = Activity.objects.create(classroom_id=self.classroom, title='Activity 1')
+        activity.team_id.add(self.team_a)
+
+        url = reverse('team-activities-list', kwargs={'class_pk': self.classroom.id, 'team_pk': self.team_a.id})
+        response = self.client_student_user.get(url)
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        etag = response['ETag']
+
+        response = self.client_student_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        activity.team_id.add(self.team_b)
+        response = self.client_student_user.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(response.data[0]['team_id']), [self.team_a.id, self.team_b.id])
@@ -1,3 +1,5 @@
-from .ClassesTest import ClassesTest
+# from .ClassesTest import ClassesTest
 # from .ClassMembersTest import ClassMembersTest
-# from .UsersTest import UsersTest
\ No newline at end of file
+# from .UsersTest import UsersTest
+from .ActivitiesTest import ActivitiesTest
+from .TeamActivitiesTest import TeamActivitiesTest
\ No newline at end of file